@@ -0,0 +1,43 @@
+from config import FPS
+
+
+# Vienas žaidimo atnaujinimas atitinka vieną kadrą
+SIMULATION_STEP = 1.0 / FPS
+
+
+class AnimationClip:
+    """A looping sequence of precomputed frames shared by many sprites."""
+    clips = {}
+
+    def __init__(self, frames, duration):
+        self.frames = frames
+        self.duration = duration
+
+    @classmethod
+    def shared(cls, key, build):
+        """Returns the clip cached under the key, building it on first use."""
+        clip = cls.clips.get(key)
+        if clip is None:
+            clip = build()
+            cls.clips[key] = clip
+        return clip
+
+    def frame_index(self, time):
+        return int(time * len(self.frames) / self.duration) % len(self.frames)
+
+    def frame_at(self, time):
+        return self.frames[self.frame_index(time)]
+
+
+class ClipPlayer:
+    """Plays an animation clip for one sprite on the simulation clock."""
+    def __init__(self, clip, time=0.0):
+        self.clip = clip
+        self.time = time
+
+    def advance(self, dt=SIMULATION_STEP):
+        self.time = (self.time + dt) % self.clip.duration
+
+    @property
+    def frame(self):
+        return self.clip.frame_at(self.time)
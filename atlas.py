@@ -0,0 +1,101 @@
+import pygame
+
+from config import ATLAS_PAGE_SIZE
+
+
+class TextureAtlas:
+    """Packs many small surfaces into a few large pages.
+
+    Items are placed on shelves, left to right, and a new page is started
+    when the current one is full. Drawing code then blits areas of the
+    pages, so a whole layer can be drawn with one `Surface.blits` call.
+    """
+    def __init__(self, page_size=ATLAS_PAGE_SIZE):
+        self.page_size = page_size
+        self.pages = []
+        self.entries = {}
+        self.shelf_page = None
+        self.cursor_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+        self.unconverted = False
+
+    def _new_page(self, size):
+        page = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        else:
+            self.unconverted = True
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        return page
+
+    def _place(self, width, height):
+        page_width, page_height = self.page_size
+        if width > page_width or height > page_height:
+            # Per didelis elementas gauna atskirą puslapį, lentynos jame nededamos
+            return self._new_page((width, height)), pygame.Rect(0, 0, width, height)
+
+        if self.cursor_x + width > page_width:
+            self.shelf_y += self.shelf_height
+            self.cursor_x = 0
+            self.shelf_height = 0
+        if self.shelf_page is None or self.shelf_y + height > page_height:
+            self.shelf_page = self._new_page(self.page_size)
+            self.cursor_x = 0
+            self.shelf_y = 0
+            self.shelf_height = 0
+
+        area = pygame.Rect(self.cursor_x, self.shelf_y, width, height)
+        self.cursor_x += width
+        self.shelf_height = max(self.shelf_height, height)
+        return self.shelf_page, area
+
+    def convert_pages(self):
+        """Converts pages made before the display existed to its format.
+
+        Does nothing until a display is set, so it is safe to call often.
+        """
+        if not self.unconverted or pygame.display.get_surface() is None:
+            return
+        converted = {}
+        for page in self.pages:
+            converted[id(page)] = page.convert_alpha()
+        self.pages = [converted[id(page)] for page in self.pages]
+        self.entries = {
+            key: (converted[id(page)], area)
+            for key, (page, area) in self.entries.items()
+        }
+        if self.shelf_page is not None:
+            self.shelf_page = converted[id(self.shelf_page)]
+        self.unconverted = False
+
+    def get(self, key):
+        """Returns the (page, area) pair for a key, or None if not packed."""
+        return self.entries.get(key)
+
+    def add(self, key, surface):
+        """Packs a surface under the given key and returns its (page, area)."""
+        if key is None:
+            raise ValueError("Atlas entries need a key.")
+        entry = self.entries.get(key)
+        if entry is None:
+            page, area = self._place(*surface.get_size())
+            page.blit(surface, area, special_flags=pygame.BLEND_RGBA_MAX)
+            entry = (page, area)
+            self.entries[key] = entry
+        return entry
+
+    def blit_item(self, key, surface, dest):
+        """Returns a (page, dest, area) tuple for `Surface.blits`.
+
+        Surfaces without a key are not packed and are blitted directly.
+        """
+        if key is None:
+            return (surface, dest)
+        self.convert_pages()
+        page, area = self.entries.get(key) or self.add(key, surface)
+        return (page, dest, area)
+
+
+atlas = TextureAtlas()
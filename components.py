@@ -3,14 +3,20 @@ import random
 import pygame
 import colorsys
 
-from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from animation import AnimationClip, ClipPlayer
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, STAR_ROTATION_FRAMES, PORTAL_HUE_STEPS
+)
 
 
 class Component(pygame.sprite.Sprite):
-    def __init__(self, x, y, width, height):
+    def __init__(self, x, y, width, height, image=None):
         super().__init__()
-        self.image = pygame.Surface((width, height))
+        if image is None:
+            image = pygame.Surface((width, height))
+        self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
+        self.atlas_key = None
 
     def draw(self, screen):
         screen.blit(self.image, self.rect)
@@ -19,7 +25,9 @@ class Component(pygame.sprite.Sprite):
 class Platform(Component):
     def __init__(self, x, y, width, height):
         super().__init__(x, y, width, height)
-        self.image.fill((0, 0, 255))
+        self.color = (0, 0, 255)
+        self.image.fill(self.color)
+        self.atlas_key = ("platform", self.rect.size, self.color)
         self.visible = True
 
 
@@ -32,6 +40,7 @@ class FallingObstacle(pygame.sprite.Sprite):
         self.image = pygame.Surface([self.width, self.height])
         self.image.fill((255, 255, 255))
         self.rect = self.image.get_rect()
+        self.atlas_key = ("obstacle", self.rect.size)
         self.reset_pos()
 
     def update(self):
@@ -47,32 +56,128 @@ class FallingObstacle(pygame.sprite.Sprite):
         screen.blit(self.image, self.rect)
 
 
+def hue_cycle_clip(
+    size, speed, saturation=1.0, value=1.0, steps=PORTAL_HUE_STEPS
+):
+    """Returns the shared clip of pre-filled frames cycling through all hues.
+
+    Each frame is an (image, atlas_key) pair and `speed` is the number of
+    full cycles per second.
+    """
+    def build():
+        frames = []
+        for step in range(steps):
+            rgb_color = tuple(
+                int(c * 255)
+                for c in colorsys.hsv_to_rgb(step / steps, saturation, value)
+            )
+            image = pygame.Surface(size)
+            image.fill(rgb_color)
+            frames.append((image, ("portal", size, rgb_color)))
+        duration = 1.0 / speed if speed > 0 else float("inf")
+        return AnimationClip(frames, duration)
+
+    key = ("hue_cycle", size, speed, saturation, value, steps)
+    return AnimationClip.shared(key, build)
+
+
 class Portal(Component):
-    def __init__(self, x, y, width, height, color_change_speed=0.2):
-        super().__init__(x, y, width, height)
-        self.hue = 0
-        self.saturation = 1.0
-        self.value = 1.0
+    def __init__(
+        self, x, y, width, height, color_change_speed=0.2,
+        saturation=1.0, value=1.0
+    ):
+        self.saturation = saturation
+        self.value = value
         self.color_change_speed = color_change_speed
-        self.last_update_time = pygame.time.get_ticks()
+        self.clip_settings = self._clip_settings()
+        color_cycle = ClipPlayer(
+            hue_cycle_clip((width, height), *self.clip_settings)
+        )
+        super().__init__(x, y, width, height, color_cycle.frame[0])
+        self.color_cycle = color_cycle
+        self.animation_interval = 1
+        self.animation_tick = 0
+        self._update_color()
+
+    def _clip_settings(self):
+        return (self.color_change_speed, self.saturation, self.value)
+
+    def _sync_clip(self):
+        """Switches to another shared clip if the colour settings changed.
+
+        The hue reached so far is kept, so a speed change does not make
+        the portal jump back to red.
+        """
+        settings = self._clip_settings()
+        if settings == self.clip_settings:
+            return
+        old_clip = self.color_cycle.clip
+        phase = old_clip.frame_index(self.color_cycle.time) / len(old_clip.frames)
+        clip = hue_cycle_clip(self.rect.size, *settings)
+        time = phase * clip.duration if clip.duration != float("inf") else 0.0
+        self.color_cycle = ClipPlayer(clip, time)
+        self.clip_settings = settings
         self._update_color()
 
     def _update_color(self):
-        rgb_color = tuple(
-            int(c * 255)
-            for c in colorsys.hsv_to_rgb(self.hue / 360.0, self.saturation, self.value)
-        )
-        self.image.fill(rgb_color)
+        self.image, self.atlas_key = self.color_cycle.frame
 
     def update(self):
-        current_time = pygame.time.get_ticks()
-        delta_time_seconds = (current_time - self.last_update_time) / 1000.0
-        self.last_update_time = current_time
-        self.hue = (self.hue + self.color_change_speed * 360 * delta_time_seconds) % 360
-        self._update_color()
+        self._sync_clip()
+        self.color_cycle.advance()
+        self.animation_tick += 1
+        if self.animation_interval and self.animation_tick >= self.animation_interval:
+            self.animation_tick = 0
+            self._update_color()
+
+
+class RotationFrames:
+    """Rotated copies of an image and their masks, built once per frame.
+
+    Angles are rounded to one of `steps` frames, so every sprite sharing
+    the same image reuses the same surfaces and collision masks.
+    """
+    def __init__(self, image, steps=STAR_ROTATION_FRAMES, key=None):
+        self.base_image = image
+        self.key = key
+        self.steps = steps
+        self.frames = [None] * steps
+
+    def frame_index(self, angle):
+        return int(angle * self.steps / 360) % self.steps
+
+    def get(self, angle):
+        """Returns the (image, mask) pair for the given angle."""
+        index = self.frame_index(angle)
+        frame = self.frames[index]
+        if frame is None:
+            image = pygame.transform.rotate(
+                self.base_image, index * 360 / self.steps
+            )
+            frame = (image, pygame.mask.from_surface(image))
+            self.frames[index] = frame
+        return frame
+
+
+_solid_masks = {}
+
+
+def collide_star(sprite, star):
+    """Checks the sprite's rect against the star's rect, then its mask."""
+    if not sprite.rect.colliderect(star.rect):
+        return False
+    size = sprite.rect.size
+    solid_mask = _solid_masks.get(size)
+    if solid_mask is None:
+        solid_mask = pygame.Mask(size, fill=True)
+        _solid_masks[size] = solid_mask
+    offset = (sprite.rect.x - star.rect.x, sprite.rect.y - star.rect.y)
+    return star.mask.overlap(solid_mask, offset) is not None
 
 
 class Star(pygame.sprite.Sprite):
+    rotations = {}
+
     def __init__(self, x, y, falling=False, speed=3):
         super().__init__()
         star_image_path = os.path.join(os.path.dirname(__file__), "star_image.png")
@@ -82,36 +187,74 @@ class Star(pygame.sprite.Sprite):
         except ImportError:
             pass
 
-        try:
-            self.original_image = pygame.image.load(star_image_path).convert_alpha()
-        except pygame.error as e:
-            print(f"Warning: Could not load star image '{star_image_path}': {e}")
-            self.original_image = pygame.Surface((30, 30), pygame.SRCALPHA)
-            pygame.draw.circle(self.original_image, (255, 255, 0), (15, 15), 15)
-
         self.target_size = (35, 35) # Padidintas dydis
-        self.image = pygame.transform.scale(self.original_image, self.target_size)
-        self.rect = self.image.get_rect(center=(x, y))
+        self.frames = self.load_frames(star_image_path, self.target_size)
         self.angle = random.randint(0, 360)
+        self.image, self.mask = self.frames.get(self.angle)
+        self.atlas_key = (self.frames.key, self.frames.frame_index(self.angle))
+        self.rect = self.image.get_rect(center=(x, y))
         self.rotation_speed = random.uniform(0.5, 2.0)
+        self.animation_interval = 1
+        self.animation_tick = 0
         self.falling = falling
         self.speed = speed if falling else 0
 
         if self.falling:
             self.reset_pos()
 
+    @classmethod
+    def load_frames(cls, image_path, size):
+        """Returns the rotation frames shared by stars with this image.
+
+        If the image cannot be loaded, shared fallback frames are returned
+        and the load is tried again for the next star.
+        """
+        key = (image_path, size)
+        frames = cls.rotations.get(key)
+        if frames is not None:
+            return frames
+
+        try:
+            original_image = pygame.image.load(image_path).convert_alpha()
+        except pygame.error as e:
+            print(f"Warning: Could not load star image '{image_path}': {e}")
+            key = (None, size)
+            frames = cls.rotations.get(key)
+            if frames is None:
+                original_image = pygame.Surface((30, 30), pygame.SRCALPHA)
+                pygame.draw.circle(original_image, (255, 255, 0), (15, 15), 15)
+                frames = RotationFrames(
+                    pygame.transform.scale(original_image, size),
+                    key=("star_fallback", size)
+                )
+                cls.rotations[key] = frames
+            return frames
+
+        frames = RotationFrames(
+            pygame.transform.scale(original_image, size), key=("star",) + key
+        )
+        cls.rotations[key] = frames
+        return frames
+
     def reset_pos(self):
         self.rect.x = random.randrange(0, SCREEN_WIDTH - self.rect.width)
         self.rect.y = random.randrange(-400, -self.rect.height)
 
     def update(self):
-        self.angle = (self.angle + self.rotation_speed) % 360
-        rotated_image = pygame.transform.rotate(
-            pygame.transform.scale(self.original_image, self.target_size), self.angle
-        )
-        old_center = self.rect.center
-        self.image = rotated_image
-        self.rect = self.image.get_rect(center=old_center)
+        self.animation_tick += 1
+        if self.animation_interval and self.animation_tick >= self.animation_interval:
+            self.angle = (
+                self.angle + self.rotation_speed * self.animation_tick
+            ) % 360
+            self.animation_tick = 0
+            image, self.mask = self.frames.get(self.angle)
+            if image is not self.image:
+                old_center = self.rect.center
+                self.image = image
+                self.atlas_key = (
+                    self.frames.key, self.frames.frame_index(self.angle)
+                )
+                self.rect = self.image.get_rect(center=old_center)
 
         if self.falling:
             self.rect.y += self.speed
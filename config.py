@@ -14,6 +14,29 @@ PLAYER_MAX_FALL_SPEED = 10
 TILE_SIZE = 40
 
 STAR_IMAGE_PATH = "star_image.png"
+STAR_ROTATION_FRAMES = 72
 
 UI_FONT_PATH = "FancyFont.ttf"
 # HEART_IMAGE_PATH = "heart.png" # Nebenaudojama PuzzleLevel
+
+# None - laikinas failas, ištrinamas įkėlus lygį
+GENERATED_MAZE_PATH = None
+GENERATED_MAZE_WIDTH = 101
+GENERATED_MAZE_HEIGHT = 101
+GENERATED_MAZE_STAR_DENSITY = 0.02
+GENERATED_MAZE_SEED = None
+
+GOVERNOR_DEGRADE_FRAMES = 30
+GOVERNOR_RESTORE_FRAMES = 180
+GOVERNOR_HEADROOM = 0.6
+HUD_REFRESH_FRAMES = 15
+
+MEMORY_REPORT = False
+MEMORY_REPORT_TOP = 10
+MEMORY_STRESS_CYCLES = 3000
+MEMORY_STRESS_TOLERANCE = 512 * 1024
+MEMORY_STRESS_SURFACE_TOLERANCE = 2 * 1024 * 1024
+MEMORY_STRESS_RSS_TOLERANCE = 16 * 1024 * 1024
+
+ATLAS_PAGE_SIZE = (1024, 1024)
+PORTAL_HUE_STEPS = 90
@@ -0,0 +1,91 @@
+from config import (
+    FPS, GOVERNOR_DEGRADE_FRAMES, GOVERNOR_RESTORE_FRAMES, GOVERNOR_HEADROOM,
+    HUD_REFRESH_FRAMES
+)
+
+
+class QualityTier:
+    """Rendering settings used while the game is at one quality level."""
+    def __init__(self, name, animation_interval, hud_interval, coarse_draw):
+        self.name = name
+        # Kas kiek kadrų atnaujinama animacija, 0 - animacija sustabdyta
+        self.animation_interval = animation_interval
+        self.hud_interval = hud_interval
+        self.coarse_draw = coarse_draw
+
+
+QUALITY_TIERS = [
+    QualityTier("full", 1, 1, False),
+    QualityTier("reduced_animation", 3, 1, False),
+    QualityTier("cached_hud", 3, HUD_REFRESH_FRAMES, False),
+    QualityTier("coarse", 0, HUD_REFRESH_FRAMES, True),
+]
+
+
+class FrameGovernor:
+    """Lowers or restores quality depending on how frames fit the budget."""
+    def __init__(
+        self, budget=1.0 / FPS, degrade_after=GOVERNOR_DEGRADE_FRAMES,
+        restore_after=GOVERNOR_RESTORE_FRAMES, headroom=GOVERNOR_HEADROOM
+    ):
+        self.budget = budget
+        self.degrade_after = degrade_after
+        self.restore_after = restore_after
+        self.headroom = headroom
+        self.tier_index = 0
+        self.frames = 0
+        self.misses = 0
+        self.slow_frames = 0
+        self.fast_frames = 0
+        self.applied_level = None
+        self.applied_tier = None
+
+    @property
+    def tier(self):
+        return QUALITY_TIERS[self.tier_index]
+
+    def record(self, frame_time):
+        """Records how long a frame took. Returns True if the tier changed."""
+        self.frames += 1
+        if frame_time > self.budget:
+            self.misses += 1
+            self.slow_frames += 1
+            self.fast_frames = 0
+        else:
+            self.slow_frames = max(0, self.slow_frames - 1)
+            if frame_time < self.budget * self.headroom:
+                self.fast_frames += 1
+            else:
+                self.fast_frames = 0
+
+        if (self.slow_frames >= self.degrade_after
+                and self.tier_index < len(QUALITY_TIERS) - 1):
+            self.tier_index += 1
+            self.slow_frames = 0
+            self.fast_frames = 0
+            return True
+        if self.fast_frames >= self.restore_after and self.tier_index > 0:
+            self.tier_index -= 1
+            self.slow_frames = 0
+            self.fast_frames = 0
+            return True
+        return False
+
+    def apply(self, level):
+        """Passes the current tier to the level if it has not seen it yet."""
+        if level is None:
+            self.applied_level = None
+            return
+        if level is not self.applied_level or self.tier is not self.applied_tier:
+            level.set_quality(self.tier)
+            self.applied_level = level
+            self.applied_tier = self.tier
+
+    def stats(self):
+        """Returns the governor state for monitoring."""
+        return {
+            "tier": self.tier.name,
+            "tier_index": self.tier_index,
+            "frames": self.frames,
+            "misses": self.misses,
+        }
@@ -1,24 +1,134 @@
 import os
 import random
+import tempfile
 import pygame
 
 from player import Player
+from maze_generator import generate_maze
+from pools import SpritePool, SurfacePool
+from atlas import atlas
 from components import (
-    Platform, FallingObstacle, Portal, Star
+    Platform, FallingObstacle, Portal, Star, collide_star
 )
 from config import (
     TILE_SIZE, PLAYER_IMAGE_PATH, PLAYER_WIDTH, PLAYER_HEIGHT,
-    SCREEN_HEIGHT, SCREEN_WIDTH, PLAYER_SPEED, STAR_IMAGE_PATH, UI_FONT_PATH
+    SCREEN_HEIGHT, SCREEN_WIDTH, PLAYER_SPEED, STAR_IMAGE_PATH, UI_FONT_PATH,
+    GENERATED_MAZE_PATH, GENERATED_MAZE_WIDTH, GENERATED_MAZE_HEIGHT,
+    GENERATED_MAZE_STAR_DENSITY, GENERATED_MAZE_SEED
     # HEART_IMAGE_PATH nebereikalingas šiam lygiui
 )
 
 
+_fonts = {}
+
+obstacle_pool = SpritePool(FallingObstacle)
+falling_star_pool = SpritePool(
+    lambda speed: Star(0, 0, falling=True, speed=speed)
+)
+hud_surfaces = SurfacePool()
+
+
+def _clear_fonts():
+    _fonts.clear()
+
+
+def load_ui_font(size, fallback_size):
+    """Returns a cached UI font, falling back to the system font.
+
+    Fonts become invalid when pygame quits, so the cache is emptied on
+    pygame.quit() and whenever the font module is not initialised.
+    """
+    if not pygame.font.get_init():
+        _clear_fonts()
+    if not _fonts:
+        pygame.register_quit(_clear_fonts)
+    key = (size, fallback_size)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(UI_FONT_PATH, size)
+        except (pygame.error, FileNotFoundError):
+            font = pygame.font.SysFont(None, fallback_size)
+        _fonts[key] = font
+    return font
+
+
 class Level:
     """Base class for all game levels."""
     def __init__(self):
         self.player = None
         self.platforms = []
         self.components = []
+        self.animation_interval = 1
+        self.hud_interval = 1
+        self.coarse_draw = False
+        self.hud_cache = {}
+
+    def set_quality(self, tier):
+        """Applies the rendering settings of a quality tier."""
+        self.animation_interval = tier.animation_interval
+        self.hud_interval = tier.hud_interval
+        self.coarse_draw = tier.coarse_draw
+        for component in self.components:
+            if hasattr(component, 'animation_interval'):
+                component.animation_interval = self.animation_interval
+
+    def add_component(self, component):
+        """Adds a component using the level's current quality settings."""
+        if hasattr(component, 'animation_interval'):
+            component.animation_interval = self.animation_interval
+        self.components.append(component)
+
+    def render_hud(self, slot, text, font, color):
+        """Returns the text surface for a HUD slot, rendering only if needed.
+
+        The text is re-rendered when it changes, but no more often than
+        every `hud_interval` frames. Each slot keeps its text in a surface
+        from the HUD pool, which is returned when the text is replaced.
+        """
+        cached = self.hud_cache.get(slot)
+        if cached is not None:
+            cached[2] += 1
+            if cached[0] == text or cached[2] < self.hud_interval:
+                return cached[1]
+            hud_surfaces.release(cached[1])
+        rendered = font.render(text, True, color)
+        surface = hud_surfaces.acquire(rendered.get_size(), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        surface.blit(rendered, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        self.hud_cache[slot] = [text, surface, 0]
+        return surface
+
+    def release(self):
+        """Returns pooled objects held by the level before it is dropped."""
+        for cached in self.hud_cache.values():
+            hud_surfaces.release(cached[1])
+        self.hud_cache = {}
+
+    def draw_sprites(self, screen, sprites, offset=(0, 0)):
+        """Draws sprites from the texture atlas with one blits call."""
+        offset_x, offset_y = offset
+        screen.blits(
+            [
+                atlas.blit_item(
+                    sprite.atlas_key, sprite.image,
+                    sprite.rect.move(-offset_x, -offset_y)
+                )
+                for sprite in sprites
+            ],
+            False
+        )
+
+    def draw_platforms(self, screen, platforms, offset=(0, 0)):
+        """Draws platforms, as plain fills when coarse drawing is on."""
+        if self.coarse_draw:
+            offset_x, offset_y = offset
+            for platform in platforms:
+                screen.fill(
+                    platform.color, platform.rect.move(-offset_x, -offset_y)
+                )
+        else:
+            self.draw_sprites(screen, platforms, offset)
 
     def update(self, keys):
         """Updates the level state, including player and components."""
@@ -27,9 +137,7 @@ class Level:
 
         if hasattr(self, 'stars') and hasattr(self, 'collected'):
             for i, star in enumerate(self.stars):
-                if not self.collected[i] and self.player.rect.colliderect(
-                    star.rect
-                ):
+                if not self.collected[i] and collide_star(self.player, star):
                     self.collected[i] = True
                     if star in self.components:
                         self.components.remove(star)
@@ -47,12 +155,10 @@ class Level:
 
     def draw(self, screen):
         """Draws all elements of the level."""
-        for platform in self.platforms:
-            platform.draw(screen)
-        for component in self.components:
-            component.draw(screen)
+        self.draw_platforms(screen, self.platforms)
+        self.draw_sprites(screen, self.components)
         if self.player:
-            self.player.draw(screen)
+            self.draw_sprites(screen, [self.player])
 
 
 class PlatformLevel(Level):
@@ -94,7 +200,7 @@ class PlatformLevel(Level):
 
         if all(self.collected) and self.portal is None:
             self.portal = Portal(*self.portal_position, 50, 50)
-            self.components.append(self.portal)
+            self.add_component(self.portal)
 
         if self.portal and self.player.rect.colliderect(self.portal.rect):
             return "completed"
@@ -103,22 +209,18 @@ class PlatformLevel(Level):
     def draw(self, screen):
         """Draws the platform level."""
         super().draw(screen)
-        try:
-            font_big = pygame.font.Font(UI_FONT_PATH, 28)
-            font = pygame.font.Font(UI_FONT_PATH, 24)
-        except (pygame.error, FileNotFoundError):
-            font_big = pygame.font.SysFont(None, 28)
-            font = pygame.font.SysFont(None, 30)
+        font_big = load_ui_font(28, 28)
+        font = load_ui_font(24, 30)
 
         message = "Surink žvaigždutes, kad atrastum portalą į sekantį lygį"
-        text_surface = font_big.render(message, True, (255, 255, 0))
+        text_surface = self.render_hud("message", message, font_big, (255, 255, 0))
         screen.blit(
             text_surface,
             (SCREEN_WIDTH // 2 - text_surface.get_width() // 2, 10)
         )
 
         collected_text = f"Surinkta: {sum(self.collected)}/{len(self.collected)}"
-        text = font.render(collected_text, True, (255, 255, 255))
+        text = self.render_hud("collected", collected_text, font, (255, 255, 255))
         screen.blit(text, (10, 10))
 
 
@@ -179,27 +281,16 @@ class MazeLevel(Level):
         else:
             offset_x, offset_y = 0, 0
 
-        for wall in self.walls:
-            screen.blit(wall.image, wall.rect.move(-offset_x, -offset_y))
-
-        for component in self.components:
-             if hasattr(component, 'rect') and hasattr(component, 'image'):
-                 screen.blit(
-                    component.image, component.rect.move(-offset_x, -offset_y)
-                 )
-
+        offset = (offset_x, offset_y)
+        self.draw_platforms(screen, self.walls, offset)
+        self.draw_sprites(screen, self.components, offset)
         if self.player:
-            screen.blit(
-                self.player.image, self.player.rect.move(-offset_x, -offset_y)
-            )
+            self.draw_sprites(screen, [self.player], offset)
 
-        try:
-            font = pygame.font.Font(UI_FONT_PATH, 24)
-        except (pygame.error, FileNotFoundError):
-            font = pygame.font.SysFont(None, 30)
+        font = load_ui_font(24, 30)
 
         collected_text = f"Surinkta: {sum(self.collected)}/{len(self.collected)}"
-        text = font.render(collected_text, True, (255, 255, 255))
+        text = self.render_hud("collected", collected_text, font, (255, 255, 255))
         screen.blit(text, (10, 10))
 
     def update(self, keys):
@@ -230,9 +321,7 @@ class MazeLevel(Level):
                     break
 
             for i, star in enumerate(self.stars):
-                if not self.collected[i] and self.player.rect.colliderect(
-                    star.rect
-                ):
+                if not self.collected[i] and collide_star(self.player, star):
                     self.collected[i] = True
                     if star in self.components:
                         self.components.remove(star)
@@ -247,7 +336,7 @@ class MazeLevel(Level):
         
         if self.end_x != -1 and all(self.collected) and self.portal is None:
             self.portal = Portal(self.end_x, self.end_y, TILE_SIZE, TILE_SIZE)
-            self.components.append(self.portal)
+            self.add_component(self.portal)
             print("Portal created in maze!")
 
        
@@ -260,6 +349,28 @@ class MazeLevel(Level):
         return None
 
 
+class GeneratedMazeLevel(MazeLevel):
+    """A maze level generated procedurally before it is loaded."""
+    def __init__(
+        self, width=GENERATED_MAZE_WIDTH, height=GENERATED_MAZE_HEIGHT,
+        star_density=GENERATED_MAZE_STAR_DENSITY, seed=GENERATED_MAZE_SEED,
+        maze_file=GENERATED_MAZE_PATH
+    ):
+        if maze_file is not None:
+            filepath = os.path.join(os.path.dirname(__file__), maze_file)
+            generate_maze(filepath, width, height, star_density, seed)
+            super().__init__(filepath)
+            return
+
+        fd, filepath = tempfile.mkstemp(suffix=".txt", prefix="maze_")
+        os.close(fd)
+        try:
+            generate_maze(filepath, width, height, star_density, seed)
+            super().__init__(filepath)
+        finally:
+            os.remove(filepath)
+
+
 class PuzzleLevel(Level):
     """A level combining platforming with puzzle elements and hazards."""
     def __init__(self):
@@ -274,14 +385,14 @@ class PuzzleLevel(Level):
 
         self.obstacles = pygame.sprite.Group()
         for _ in range(7):
-            obstacle = FallingObstacle(speed=random.randint(3, 6))
+            obstacle = obstacle_pool.acquire(speed=random.randint(3, 6))
             self.obstacles.add(obstacle)
             self.components.append(obstacle)
 
         
         self.falling_stars = pygame.sprite.Group()
         for _ in range(1): 
-            star = Star(0, 0, falling=True, speed=random.randint(2, 5))
+            star = falling_star_pool.acquire(speed=random.randint(2, 5))
             self.falling_stars.add(star)
             self.components.append(star)
 
@@ -289,8 +400,9 @@ class PuzzleLevel(Level):
         self.star_goal = 3 
 
         # Sukuriame raudoną kvadratuką gyvybėms rodyti
-        self.heart_image = pygame.Surface((25, 25)) # Kvadratuko dydis
+        self.heart_image = hud_surfaces.acquire((25, 25)) # Kvadratuko dydis
         self.heart_image.fill((255, 0, 0)) # Raudona spalva
+        self.heart_key = ("heart", self.heart_image.get_size(), (255, 0, 0))
 
     def update(self, keys):
         """Updates the puzzle level state."""
@@ -299,7 +411,7 @@ class PuzzleLevel(Level):
         
         if self.player:
             collided_stars = pygame.sprite.spritecollide(
-                self.player, self.falling_stars, False
+                self.player, self.falling_stars, False, collide_star
             )
             for star in collided_stars:
                 self.collected_falling_stars += 1
@@ -329,29 +441,42 @@ class PuzzleLevel(Level):
 
         return None
 
+    def release(self):
+        """Returns obstacles, stars and the heart surface to their pools."""
+        super().release()
+        for obstacle in self.obstacles.sprites():
+            obstacle_pool.release(obstacle)
+        for star in self.falling_stars.sprites():
+            falling_star_pool.release(star)
+        self.components = []
+        hud_surfaces.release(self.heart_image)
+        self.heart_image = None
+
     def draw(self, screen):
         """Draws the puzzle level and UI elements."""
         super().draw(screen) 
 
-        try:
-            font = pygame.font.Font(UI_FONT_PATH, 28)
-            font_instr = pygame.font.Font(UI_FONT_PATH, 28)
-        except (pygame.error, FileNotFoundError):
-            font = pygame.font.SysFont(None, 30)
-            font_instr = pygame.font.SysFont(None, 30)
+        font = load_ui_font(28, 30)
+        font_instr = load_ui_font(28, 30)
 
         # Piešiame širdeles vietoje teksto
         heart_x_start = SCREEN_WIDTH - 10 - self.heart_image.get_width()
+        hearts = []
         for i in range(self.lives):
             heart_x = heart_x_start - i * (self.heart_image.get_width() + 5) # 5 yra tarpas tarp širdelių
-            screen.blit(self.heart_image, (heart_x, 10))
+            hearts.append(
+                atlas.blit_item(self.heart_key, self.heart_image, (heart_x, 10))
+            )
+        screen.blits(hearts, False)
             
         stars_text_str = f"Žvaigždės: {self.collected_falling_stars}/{self.star_goal}"
-        stars_text = font.render(stars_text_str, True, (255, 255, 0))
+        stars_text = self.render_hud("stars", stars_text_str, font, (255, 255, 0))
         screen.blit(stars_text, (10, 10))
 
         instr_text_str = "Rink žvaigždes!"
-        instr_text = font_instr.render(instr_text_str, True, (255, 255, 0))
+        instr_text = self.render_hud(
+            "instructions", instr_text_str, font_instr, (255, 255, 0)
+        )
         screen.blit(
             instr_text,
             (SCREEN_WIDTH // 2 - instr_text.get_width() // 2, 10)
@@ -360,12 +485,17 @@ class PuzzleLevel(Level):
 
 class LevelFactory:
     """Factory class to create different types of levels."""
-    def create_level(self, level_type):
-        """Creates a level instance based on the type."""
+    def create_level(self, level_type, **options):
+        """Creates a level instance based on the type.
+
+        Options are passed on to generated maze levels.
+        """
         if level_type == "platform":
             return PlatformLevel()
         elif level_type == "maze":
             return MazeLevel()
+        elif level_type == "generated":
+            return GeneratedMazeLevel(**options)
         elif level_type == "puzzle":
             return PuzzleLevel()
         print(f"Warning: Unknown level type '{level_type}' requested.")
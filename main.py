@@ -1,6 +1,9 @@
+import time
 import pygame
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, UI_FONT_PATH
-from levels import LevelFactory
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, UI_FONT_PATH, MEMORY_REPORT
+from governor import FrameGovernor
+from levels import LevelFactory, load_ui_font
+from memprofile import MemoryMonitor
 
 
 def draw_text(surface, text, font, color, center_pos):
@@ -41,14 +44,19 @@ def main():
     level_types = ["platform", "maze", "puzzle"]
     current_level_index = 0
     level_factory = LevelFactory()
+    memory_monitor = MemoryMonitor() if MEMORY_REPORT else None
 
-    def load_level(index):
+    def load_level(index, previous=None):
+        level = None
         if index < len(level_types):
             level_type = level_types[index]
             print(f"Loading level {index + 1}: {level_type}")
-            return level_factory.create_level(level_type)
-        print("All levels completed!")
-        return None
+            level = level_factory.create_level(level_type)
+        else:
+            print("All levels completed!")
+        if memory_monitor:
+            print(memory_monitor.level_loaded(previous, level))
+        return level
 
     current_level = load_level(current_level_index)
 
@@ -59,8 +67,10 @@ def main():
 
     running = True
     show_end_screen = False
+    governor = FrameGovernor()
 
     while running:
+        frame_start = time.perf_counter()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -75,13 +85,15 @@ def main():
                     f"({level_types[current_level_index]}) completed!"
                 )
                 current_level_index += 1
-                current_level = load_level(current_level_index)
+                current_level.release()
+                current_level = load_level(current_level_index, current_level)
                 if not current_level:
                     running = False
 
             elif level_status == "restart":
                 print(f"Perkraunamas lygis {current_level_index + 1}")
-                current_level = load_level(current_level_index)
+                current_level.release()
+                current_level = load_level(current_level_index, current_level)
                 if not current_level:
                     print("KLAIDA: Nepavyko perkrauti lygio.")
                     running = False
@@ -89,19 +101,18 @@ def main():
             elif level_status == "show_end_message":
                 print("Žaidimo pabaiga - surinktos visos žvaigždės!")
                 show_end_screen = True
+                current_level.release()
                 current_level = None
 
         elif not current_level and not show_end_screen:
             running = False
 
+        governor.apply(current_level)
         screen.fill((0, 0, 0))
         if current_level:
             current_level.draw(screen)
         elif show_end_screen:
-            try:
-                end_font = pygame.font.Font(UI_FONT_PATH, 60)
-            except (pygame.error, FileNotFoundError):
-                end_font = pygame.font.SysFont(None, 72)
+            end_font = load_ui_font(60, 72)
             draw_text(
                 screen,
                 "Žaidimo pabaiga",
@@ -111,6 +122,12 @@ def main():
             )
 
         pygame.display.flip()
+        if governor.record(time.perf_counter() - frame_start):
+            stats = governor.stats()
+            print(
+                f"Kokybės lygis: {stats['tier']} "
+                f"(viršyta kadrų: {stats['misses']})"
+            )
         clock.tick(FPS)
 
     pygame.quit()
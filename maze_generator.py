@@ -0,0 +1,109 @@
+import argparse
+import random
+
+
+WALL = '#'
+OPEN = ' '
+START = 'P'
+STAR = '*'
+EXIT = 'E'
+
+
+def check_maze_size(width, height, star_density):
+    """Raises ValueError if a maze with these settings cannot be generated."""
+    if width < 3 or height < 3 or ((width - 1) // 2) * ((height - 1) // 2) < 2:
+        raise ValueError(
+            "Maze must be at least 3x3 tiles and at least 5 tiles wide or "
+            "high, so that P and E are on different tiles."
+        )
+    if not 0.0 <= star_density <= 1.0:
+        raise ValueError("Star density must be between 0 and 1.")
+
+
+def iter_maze_rows(width, height, star_density=0.05, seed=None):
+    """Returns an iterator over the rows of a maze in the maze1.txt format.
+
+    The maze is carved with the sidewinder algorithm, which only needs the
+    current row of cells, so memory use grows with the width and never with
+    the height of the maze. Even sizes are padded with an extra wall. The
+    settings are checked before the iterator is returned.
+    """
+    check_maze_size(width, height, star_density)
+    return _maze_rows(width, height, star_density, seed)
+
+
+def _maze_rows(width, height, star_density, seed):
+    rng = random.Random(seed)
+    cols = (width - 1) // 2
+    rows = (height - 1) // 2
+
+    def open_tile(row, col):
+        if (row, col) == (1, 1):
+            return START
+        if (row, col) == (2 * rows - 1, 2 * cols - 1):
+            return EXIT
+        if star_density and rng.random() < star_density:
+            return STAR
+        return OPEN
+
+    yield WALL * width
+
+    for r in range(rows):
+        north = [False] * cols
+        east = [False] * cols
+        if r == 0:
+            east[:cols - 1] = [True] * (cols - 1)
+        else:
+            run_start = 0
+            for c in range(cols):
+                if c == cols - 1 or rng.random() < 0.5:
+                    north[rng.randint(run_start, c)] = True
+                    run_start = c + 1
+                else:
+                    east[c] = True
+
+        tile_row = 2 * r + 1
+        if r > 0:
+            line = [WALL] * width
+            for c in range(cols):
+                if north[c]:
+                    line[2 * c + 1] = open_tile(tile_row - 1, 2 * c + 1)
+            yield ''.join(line)
+
+        line = [WALL] * width
+        for c in range(cols):
+            line[2 * c + 1] = open_tile(tile_row, 2 * c + 1)
+            if east[c]:
+                line[2 * c + 2] = open_tile(tile_row, 2 * c + 2)
+        yield ''.join(line)
+
+    for _ in range(height - 2 * rows):
+        yield WALL * width
+
+
+def generate_maze(path, width, height, star_density=0.05, seed=None):
+    """Writes a random maze to a text file, one row at a time."""
+    rows = iter_maze_rows(width, height, star_density, seed)
+    with open(path, 'w') as f:
+        for line in rows:
+            f.write(line)
+            f.write('\n')
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates a maze file.")
+    parser.add_argument("path")
+    parser.add_argument("width", type=int)
+    parser.add_argument("height", type=int)
+    parser.add_argument("--stars", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    try:
+        generate_maze(args.path, args.width, args.height, args.stars, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+import weakref
+
+import pygame
+
+from animation import AnimationClip
+from atlas import atlas
+from components import Star
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, MEMORY_REPORT_TOP, MEMORY_STRESS_CYCLES,
+    MEMORY_STRESS_TOLERANCE, MEMORY_STRESS_SURFACE_TOLERANCE,
+    MEMORY_STRESS_RSS_TOLERANCE
+)
+from levels import LevelFactory, hud_surfaces
+
+
+STRESS_WARMUP = 50
+
+
+def surface_bytes(surface):
+    """Returns the number of bytes used by the pixels of a surface."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def shared_surface_bytes():
+    """Returns the pixel bytes held by caches shared between levels.
+
+    This covers the texture atlas, star rotation frames, animation clip
+    frames and surfaces waiting in the HUD pool.
+    """
+    total = sum(surface_bytes(page) for page in atlas.pages)
+    for frames in Star.rotations.values():
+        total += surface_bytes(frames.base_image)
+        for frame in frames.frames:
+            if frame is not None:
+                total += surface_bytes(frame[0])
+    for clip in AnimationClip.clips.values():
+        for frame in clip.frames:
+            if isinstance(frame, tuple):
+                frame = frame[0]
+            if isinstance(frame, pygame.Surface):
+                total += surface_bytes(frame)
+    for surfaces in hud_surfaces.free.values():
+        total += sum(surface_bytes(surface) for surface in surfaces)
+    return total
+
+
+def process_rss():
+    """Returns the resident memory of this process, or None if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _find_surfaces(value, label, owner, seen, found):
+    if id(value) in seen:
+        return
+    if isinstance(value, pygame.Surface):
+        seen.add(id(value))
+        found.append((label, owner, value))
+    elif isinstance(value, pygame.sprite.AbstractGroup):
+        seen.add(id(value))
+        for i, sprite in enumerate(value.sprites()):
+            _find_surfaces(sprite, f"{label}[{i}]", owner, seen, found)
+    elif isinstance(value, pygame.sprite.Sprite):
+        seen.add(id(value))
+        for name, attr in vars(value).items():
+            if not name.startswith('_'):
+                _find_surfaces(
+                    attr, f"{label}.{name}", type(value).__name__, seen, found
+                )
+    elif isinstance(value, (list, tuple)):
+        seen.add(id(value))
+        for i, item in enumerate(value):
+            _find_surfaces(item, f"{label}[{i}]", owner, seen, found)
+    elif isinstance(value, dict):
+        seen.add(id(value))
+        for key, item in value.items():
+            _find_surfaces(item, f"{label}[{key!r}]", owner, seen, found)
+
+
+def level_memory(level):
+    """Returns the surface memory held by a level.
+
+    The result holds the total bytes, the bytes per component type and
+    every surface as a (label, size, bytes) tuple, largest first.
+    """
+    found = []
+    seen = set()
+    level_name = type(level).__name__
+    for name, value in vars(level).items():
+        _find_surfaces(value, name, level_name, seen, found)
+
+    by_type = {}
+    surfaces = []
+    for label, owner, surface in found:
+        size = surface_bytes(surface)
+        by_type[owner] = by_type.get(owner, 0) + size
+        surfaces.append((label, surface.get_size(), size))
+    surfaces.sort(key=lambda entry: entry[2], reverse=True)
+    return {
+        "level": level_name,
+        "bytes": sum(by_type.values()),
+        "by_type": by_type,
+        "surfaces": surfaces,
+    }
+
+
+def format_level_memory(report, top=MEMORY_REPORT_TOP):
+    lines = [f"{report['level']}: {report['bytes']} B in surfaces"]
+    for owner, size in sorted(
+        report["by_type"].items(), key=lambda item: item[1], reverse=True
+    ):
+        lines.append(f"  {owner}: {size} B")
+    for label, (width, height), size in report["surfaces"][:top]:
+        lines.append(f"  {label} {width}x{height}: {size} B")
+    return "\n".join(lines)
+
+
+class MemoryMonitor:
+    """Reports memory held by levels and what changed between level loads."""
+    def __init__(self, top=MEMORY_REPORT_TOP):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.top = top
+        self.snapshot = tracemalloc.take_snapshot()
+        self.released_levels = []
+
+    def leaked_levels(self):
+        """Returns released levels that are still referenced somewhere."""
+        gc.collect()
+        self.released_levels = [
+            ref for ref in self.released_levels if ref() is not None
+        ]
+        return [ref() for ref in self.released_levels]
+
+    def level_loaded(self, previous, level):
+        """Returns a report comparing memory with the previous level load."""
+        leaked = self.leaked_levels()
+        if previous is not None:
+            self.released_levels.append(weakref.ref(previous))
+
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self.snapshot, "lineno")
+        self.snapshot = snapshot
+
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Python memory: {current} B (peak {peak} B)"]
+        for stat in stats[:self.top]:
+            lines.append(f"  {stat}")
+        if level is not None:
+            lines.append(format_level_memory(level_memory(level), self.top))
+        for old_level in leaked:
+            lines.append(
+                f"Leak: released {type(old_level).__name__} is still alive"
+            )
+            lines.append(format_level_memory(level_memory(old_level), self.top))
+        return "\n".join(lines)
+
+
+def run_stress(
+    cycles=MEMORY_STRESS_CYCLES, level_types=("platform", "maze", "puzzle"),
+    warmup=STRESS_WARMUP, samples=10, tolerance=MEMORY_STRESS_TOLERANCE,
+    surface_tolerance=MEMORY_STRESS_SURFACE_TOLERANCE,
+    rss_tolerance=MEMORY_STRESS_RSS_TOLERANCE
+):
+    """Creates, draws and releases levels over and over.
+
+    After the warmup cycles it samples traced Python memory, the pixel
+    bytes of live levels and shared caches, and the process RSS where the
+    platform reports it. Raises RuntimeError if released levels stay alive
+    or any sample grows by more than its tolerance. Returns the samples
+    as (traced, surfaces, rss) tuples otherwise.
+    """
+    if cycles <= warmup:
+        raise ValueError("Stress cycles must be more than the warmup cycles.")
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    factory = LevelFactory()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Matuojama visada prie to paties lygio tipo
+    sample_every = max(1, (cycles - warmup) // samples // len(level_types))
+    sample_every *= len(level_types)
+    readings = []
+    released = []
+    level = None
+
+    for i in range(cycles):
+        if level is not None:
+            level.release()
+            released.append(weakref.ref(level))
+        level = factory.create_level(level_types[i % len(level_types)])
+        level.draw(screen)
+        if i >= warmup and (i - warmup) % sample_every == 0:
+            gc.collect()
+            released = [ref for ref in released if ref() is not None]
+            surfaces = shared_surface_bytes() + level_memory(level)["bytes"]
+            for ref in released:
+                surfaces += level_memory(ref())["bytes"]
+            readings.append(
+                (tracemalloc.get_traced_memory()[0], surfaces, process_rss())
+            )
+
+    level.release()
+    released.append(weakref.ref(level))
+    level = None
+    gc.collect()
+
+    alive = sum(1 for ref in released if ref() is not None)
+    if alive:
+        raise RuntimeError(f"{alive} released levels are still alive.")
+    if len(readings) > 1:
+        first, last = readings[0], readings[-1]
+        checks = (
+            ("Traced memory", 0, tolerance),
+            ("Surface memory", 1, surface_tolerance),
+            ("Process RSS", 2, rss_tolerance),
+        )
+        for name, index, limit in checks:
+            if first[index] is None or last[index] is None:
+                continue
+            growth = last[index] - first[index]
+            if growth > limit:
+                raise RuntimeError(
+                    f"{name} grew by {growth} B over {cycles} level loads."
+                )
+    return readings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Level memory profiling.")
+    parser.add_argument(
+        "--stress", type=int, nargs="?", const=MEMORY_STRESS_CYCLES,
+        metavar="CYCLES", help="cycle levels and fail if memory keeps growing"
+    )
+    args = parser.parse_args()
+    if args.stress is not None and args.stress <= STRESS_WARMUP:
+        parser.error(f"--stress needs more than {STRESS_WARMUP} cycles")
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    if args.stress is not None:
+        try:
+            readings = run_stress(args.stress)
+        except RuntimeError as e:
+            print(f"FAILED: {e}")
+            sys.exit(1)
+        if not readings:
+            print("OK: no memory samples were taken")
+        else:
+            for name, first, last in zip(
+                ("traced", "surfaces", "rss"), readings[0], readings[-1]
+            ):
+                print(f"OK {name}: {first} B -> {last} B")
+    else:
+        factory = LevelFactory()
+        for level_type in ("platform", "maze", "puzzle"):
+            level = factory.create_level(level_type)
+            print(format_level_memory(level_memory(level)))
+            level.release()
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
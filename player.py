@@ -11,9 +11,11 @@ from config import (
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y, image_path, width=None, height=None):
         super().__init__()
+        image_key = image_path
         try:
             original_image = pygame.image.load(image_path).convert_alpha()
         except pygame.error as e:
+            image_key = None
             print(f"Warning: Could not load image '{image_path}': {e}")
             print("Creating a default red square instead.")
             original_image = pygame.Surface((width or 30, height or 40))
@@ -25,6 +27,10 @@ class Player(pygame.sprite.Sprite):
             self.image = pygame.transform.scale(original_image, (width, height))
 
         self.rect = self.image.get_rect(topleft=(x, y))
+        if image_key is None:
+            self.atlas_key = ("player_fallback", self.image.get_size())
+        else:
+            self.atlas_key = ("player", image_key, self.image.get_size())
         self.x = float(x)
         self.y = float(y)
         self.speed_x = 0
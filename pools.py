@@ -0,0 +1,52 @@
+import pygame
+
+
+class SpritePool:
+    """Keeps released sprites so they can be reused instead of constructed."""
+    def __init__(self, factory):
+        self.factory = factory
+        self.free = []
+        self.created = 0
+
+    def acquire(self, **attributes):
+        """Returns a sprite, reusing a released one when possible.
+
+        A reused sprite gets the given attributes and is reinitialised
+        with its `reset_pos` method.
+        """
+        if not self.free:
+            self.created += 1
+            return self.factory(**attributes)
+        sprite = self.free.pop()
+        for name, value in attributes.items():
+            setattr(sprite, name, value)
+        sprite.reset_pos()
+        return sprite
+
+    def release(self, sprite):
+        """Removes the sprite from all groups and keeps it for reuse."""
+        sprite.kill()
+        if sprite not in self.free:
+            self.free.append(sprite)
+
+
+class SurfacePool:
+    """Keeps released surfaces so surfaces of the same size can be reused."""
+    def __init__(self):
+        self.free = {}
+        self.created = 0
+
+    def acquire(self, size, flags=0):
+        """Returns a surface of the given size. Its contents are undefined."""
+        key = (tuple(size), flags & pygame.SRCALPHA)
+        surfaces = self.free.get(key)
+        if surfaces:
+            return surfaces.pop()
+        self.created += 1
+        return pygame.Surface(size, flags)
+
+    def release(self, surface):
+        key = (surface.get_size(), surface.get_flags() & pygame.SRCALPHA)
+        surfaces = self.free.setdefault(key, [])
+        if surface not in surfaces:
+            surfaces.append(surface)
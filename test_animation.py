@@ -0,0 +1,38 @@
+import unittest
+from animation import AnimationClip, ClipPlayer
+
+class TestAnimationClip(unittest.TestCase):
+    def test_frame_at(self):
+        clip = AnimationClip(["a", "b", "c", "d"], duration=2.0)
+        self.assertEqual(clip.frame_at(0.0), "a")
+        self.assertEqual(clip.frame_at(0.6), "b")
+        self.assertEqual(clip.frame_at(1.9), "d")
+
+    def test_shared_clip_built_once(self):
+        built = []
+
+        def build():
+            built.append(True)
+            return AnimationClip([1, 2], duration=1.0)
+
+        first = AnimationClip.shared(("test", "shared"), build)
+        second = AnimationClip.shared(("test", "shared"), build)
+        self.assertIs(first, second)
+        self.assertEqual(len(built), 1)
+
+class TestClipPlayer(unittest.TestCase):
+    def test_advance_loops(self):
+        player = ClipPlayer(AnimationClip(["a", "b"], duration=1.0))
+        player.advance(0.75)
+        self.assertEqual(player.frame, "b")
+        player.advance(0.5)
+        self.assertAlmostEqual(player.time, 0.25)
+        self.assertEqual(player.frame, "a")
+
+    def test_clip_with_infinite_duration_stays(self):
+        player = ClipPlayer(AnimationClip(["a", "b"], duration=float("inf")))
+        player.advance(100.0)
+        self.assertEqual(player.frame, "a")
+
+if __name__ == "__main__":
+    unittest.main()
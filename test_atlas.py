@@ -0,0 +1,79 @@
+import unittest
+import pygame
+from atlas import TextureAtlas
+
+class TestTextureAtlas(unittest.TestCase):
+    def setUp(self):
+        self.atlas = TextureAtlas(page_size=(64, 64))
+
+    def make_surface(self, size, color):
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(color)
+        return surface
+
+    def test_same_key_packed_once(self):
+        first = self.atlas.add("a", self.make_surface((10, 10), (255, 0, 0, 255)))
+        second = self.atlas.add("a", self.make_surface((10, 10), (0, 255, 0, 255)))
+        self.assertEqual(first, second)
+        self.assertEqual(self.atlas.get("a"), first)
+        self.assertIsNone(self.atlas.get("b"))
+
+    def test_items_do_not_overlap(self):
+        areas = []
+        for i in range(20):
+            page, area = self.atlas.add(i, self.make_surface((20, 12), (i, 0, 0, 255)))
+            for other_page, other_area in areas:
+                if other_page is page:
+                    self.assertFalse(area.colliderect(other_area))
+            areas.append((page, area))
+        self.assertEqual(len(self.atlas.pages), 2)
+
+    def test_pixels_copied_exactly(self):
+        color = (200, 100, 50, 128)
+        page, area = self.atlas.add("a", self.make_surface((5, 5), color))
+        self.assertEqual(tuple(page.get_at(area.topleft)), color)
+
+    def test_large_item_gets_own_page(self):
+        page, area = self.atlas.add("big", self.make_surface((100, 10), (0, 0, 0, 255)))
+        self.assertEqual(page.get_size(), (100, 10))
+        self.assertEqual(area.topleft, (0, 0))
+
+    def test_small_item_after_large_item_keeps_shelf_page(self):
+        small_page, _ = self.atlas.add("a", self.make_surface((10, 10), (255, 0, 0, 255)))
+        big_page, big_area = self.atlas.add("big", self.make_surface((100, 10), (0, 0, 255, 255)))
+        page, area = self.atlas.add("b", self.make_surface((10, 10), (0, 255, 0, 255)))
+        self.assertIs(page, small_page)
+        self.assertEqual(area.topleft, (10, 0))
+        self.assertEqual(tuple(big_page.get_at((10, 0))), (0, 0, 255, 255))
+
+    def test_key_required(self):
+        surface = self.make_surface((4, 4), (0, 0, 255, 255))
+        with self.assertRaises(ValueError):
+            self.atlas.add(None, surface)
+        self.assertEqual(self.atlas.blit_item(None, surface, (1, 2)), (surface, (1, 2)))
+        self.assertEqual(self.atlas.entries, {})
+
+    def test_blit_item(self):
+        surface = self.make_surface((4, 4), (0, 0, 255, 255))
+        page, dest, area = self.atlas.blit_item("a", surface, (7, 8))
+        self.assertEqual(dest, (7, 8))
+        self.assertEqual(area.size, (4, 4))
+
+    def test_pages_converted_when_display_appears(self):
+        pygame.display.quit()
+        color = (200, 100, 50, 128)
+        self.atlas.add("a", self.make_surface((5, 5), color))
+        self.assertTrue(self.atlas.unconverted)
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            page, dest, area = self.atlas.blit_item("a", None, (0, 0))
+            self.assertFalse(self.atlas.unconverted)
+            self.assertEqual(self.atlas.pages, [page])
+            self.assertIs(self.atlas.shelf_page, page)
+            self.assertEqual(tuple(page.get_at(area.topleft)), color)
+        finally:
+            pygame.display.quit()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from components import Portal, Platform, Star, FallingObstacle
+import pygame
+from components import Portal, Platform, Star, FallingObstacle, collide_star
 
 class TestPortal(unittest.TestCase):
     def test_portal_size(self):
@@ -7,6 +8,37 @@ class TestPortal(unittest.TestCase):
         self.assertEqual(portal.rect.width, 40)
         self.assertEqual(portal.rect.height, 60)
 
+    def test_portals_share_color_frames(self):
+        first = Portal(0, 0, 40, 40)
+        second = Portal(100, 0, 40, 40)
+        self.assertIs(first.color_cycle.clip, second.color_cycle.clip)
+        self.assertIs(first.image, second.image)
+        self.assertIs(first.image, first.color_cycle.frame[0])
+
+    def test_portal_color_follows_updates(self):
+        portal = Portal(0, 0, 40, 40, color_change_speed=1.0)
+        start_color = portal.image.get_at((0, 0))
+        for _ in range(30):
+            portal.update()
+        self.assertAlmostEqual(portal.color_cycle.time, 0.5)
+        self.assertNotEqual(portal.image.get_at((0, 0)), start_color)
+
+    def test_portal_color_settings_used(self):
+        portal = Portal(0, 0, 40, 40, saturation=0.0, value=0.5)
+        self.assertEqual(tuple(portal.image.get_at((0, 0)))[:3], (127, 127, 127))
+        portal.value = 1.0
+        portal.update()
+        self.assertEqual(tuple(portal.image.get_at((0, 0)))[:3], (255, 255, 255))
+
+    def test_portal_speed_change_keeps_hue(self):
+        portal = Portal(0, 0, 40, 40, color_change_speed=1.0)
+        for _ in range(30):
+            portal.update()
+        portal.color_change_speed = 0.5
+        portal.update()
+        self.assertEqual(portal.color_cycle.clip.duration, 2.0)
+        self.assertAlmostEqual(portal.color_cycle.time, 1.0, delta=0.05)
+
 class TestPlatform(unittest.TestCase):
     def test_platform_position(self):
         platform = Platform(10, 20, 100, 15)
@@ -17,6 +49,52 @@ class TestStar(unittest.TestCase):
         star = Star(300, 150)
         self.assertEqual((star.rect.centerx, star.rect.centery), (300, 150))
 
+    def test_stars_share_rotation_frames(self):
+        first = Star(100, 100)
+        second = Star(200, 200)
+        second.angle = first.angle
+        second.rotation_speed = first.rotation_speed
+        first.update()
+        second.update()
+        self.assertIs(first.frames, second.frames)
+        self.assertIs(first.image, second.image)
+        self.assertIs(first.mask, second.mask)
+
+    def test_star_image_loaded_after_fallback(self):
+        pygame.display.quit()
+        fallback = Star(0, 0)
+        self.assertEqual(fallback.frames.key[0], "star_fallback")
+        pygame.display.init()
+        pygame.display.set_mode((10, 10))
+        try:
+            star = Star(0, 0)
+            self.assertEqual(star.frames.key[0], "star")
+        finally:
+            pygame.display.quit()
+
+    def test_star_animation_frozen(self):
+        star = Star(300, 150)
+        star.animation_interval = 0
+        angle = star.angle
+        star.update()
+        self.assertEqual(star.angle, angle)
+
+    def test_star_corner_does_not_collide(self):
+        star = Star(300, 150)
+        width, height = star.mask.get_size()
+        empty = next(
+            (x, y) for y in range(height) for x in range(width)
+            if not star.mask.get_at((x, y))
+        )
+        corner = pygame.sprite.Sprite()
+        corner.rect = pygame.Rect(
+            (star.rect.x + empty[0], star.rect.y + empty[1]), (1, 1)
+        )
+        self.assertTrue(corner.rect.colliderect(star.rect))
+        self.assertFalse(collide_star(corner, star))
+        corner.rect.center = star.rect.center
+        self.assertTrue(collide_star(corner, star))
+
 class TestFallingObstacle(unittest.TestCase):
     def test_obstacle_falling(self):
         obstacle = FallingObstacle(speed=4)
@@ -0,0 +1,44 @@
+import unittest
+from governor import FrameGovernor, QUALITY_TIERS
+from levels import PlatformLevel
+
+class TestFrameGovernor(unittest.TestCase):
+    def setUp(self):
+        self.governor = FrameGovernor(
+            budget=0.01, degrade_after=3, restore_after=5, headroom=0.5
+        )
+
+    def test_degrades_after_slow_frames(self):
+        for _ in range(2):
+            self.assertFalse(self.governor.record(0.02))
+        self.assertTrue(self.governor.record(0.02))
+        self.assertEqual(self.governor.tier_index, 1)
+        self.assertEqual(self.governor.misses, 3)
+
+    def test_never_leaves_tier_range(self):
+        for _ in range(100):
+            self.governor.record(0.02)
+        self.assertEqual(self.governor.tier_index, len(QUALITY_TIERS) - 1)
+        for _ in range(100):
+            self.governor.record(0.001)
+        self.assertEqual(self.governor.tier_index, 0)
+
+    def test_frames_within_budget_keep_tier(self):
+        for _ in range(3):
+            self.governor.record(0.02)
+        for _ in range(10):
+            self.governor.record(0.008)
+        self.assertEqual(self.governor.tier_index, 1)
+
+    def test_apply_sets_level_quality(self):
+        level = PlatformLevel()
+        self.governor.tier_index = len(QUALITY_TIERS) - 1
+        self.governor.apply(level)
+        self.assertTrue(level.coarse_draw)
+        self.assertEqual(level.animation_interval, self.governor.tier.animation_interval)
+        for star in level.stars:
+            self.assertEqual(star.animation_interval, level.animation_interval)
+        self.assertEqual(self.governor.stats()["tier"], self.governor.tier.name)
+
+if __name__ == "__main__":
+    unittest.main()
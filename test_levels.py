@@ -1,5 +1,10 @@
+import os
+import tempfile
 import unittest
-from levels import LevelFactory, PlatformLevel, MazeLevel, PuzzleLevel
+import pygame
+from levels import (
+    LevelFactory, PlatformLevel, MazeLevel, GeneratedMazeLevel, PuzzleLevel
+)
 
 class TestLevelFactory(unittest.TestCase):
     def setUp(self):
@@ -13,6 +18,33 @@ class TestLevelFactory(unittest.TestCase):
         level = self.factory.create_level("maze")
         self.assertIsInstance(level, MazeLevel)
 
+    def test_create_generated_level(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            level = self.factory.create_level(
+                "generated", width=21, height=21, seed=1,
+                maze_file=os.path.join(tmp, "maze.txt")
+            )
+        self.assertIsInstance(level, GeneratedMazeLevel)
+        self.assertEqual(len(level.maze_data), 21)
+        self.assertEqual(len(level.stars), len(level.collected))
+
+    def test_generated_level_removes_temp_file(self):
+        before = set(os.listdir(tempfile.gettempdir()))
+        level = self.factory.create_level("generated", width=21, height=21, seed=1)
+        self.assertEqual(len(level.maze_data), 21)
+        self.assertEqual(set(os.listdir(tempfile.gettempdir())), before)
+
+    def test_draw_after_pygame_restart(self):
+        pygame.init()
+        screen = pygame.Surface((100, 100))
+        level = PlatformLevel()
+        level.draw(screen)
+        pygame.quit()
+        pygame.init()
+        level.collected[0] = True
+        level.draw(screen)
+        PlatformLevel().draw(screen)
+
     def test_create_puzzle_level(self):
         level = self.factory.create_level("puzzle")
         self.assertIsInstance(level, PuzzleLevel)
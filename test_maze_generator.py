@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from collections import deque
+from maze_generator import iter_maze_rows, generate_maze
+
+class TestMazeGenerator(unittest.TestCase):
+    def test_maze_size(self):
+        rows = list(iter_maze_rows(21, 10, seed=1))
+        self.assertEqual(len(rows), 10)
+        self.assertTrue(all(len(row) == 21 for row in rows))
+
+    def test_same_seed_same_maze(self):
+        first = list(iter_maze_rows(31, 31, seed=7))
+        second = list(iter_maze_rows(31, 31, seed=7))
+        self.assertEqual(first, second)
+
+    def test_start_and_exit_connected(self):
+        rows = list(iter_maze_rows(41, 25, star_density=0.1, seed=3))
+        text = "".join(rows)
+        self.assertEqual(text.count("P"), 1)
+        self.assertEqual(text.count("E"), 1)
+        self.assertTrue(set(text) <= set("# P*E"))
+
+        start = next(
+            (r, c) for r, row in enumerate(rows)
+            for c, char in enumerate(row) if char == "P"
+        )
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            r, c = queue.popleft()
+            for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+                if (nr, nc) not in seen and rows[nr][nc] != "#":
+                    seen.add((nr, nc))
+                    queue.append((nr, nc))
+        self.assertTrue(any(rows[r][c] == "E" for r, c in seen))
+
+    def test_no_stars_when_density_zero(self):
+        rows = list(iter_maze_rows(31, 31, star_density=0, seed=2))
+        self.assertNotIn("*", "".join(rows))
+
+    def test_too_small_maze_rejected(self):
+        for width, height in ((2, 9), (9, 2), (3, 3), (4, 4)):
+            with self.assertRaises(ValueError):
+                list(iter_maze_rows(width, height))
+        self.assertEqual(len(list(iter_maze_rows(5, 3, seed=1))), 3)
+
+    def test_invalid_size_keeps_existing_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "maze.txt")
+            with open(path, "w") as f:
+                f.write("old")
+            with self.assertRaises(ValueError):
+                generate_maze(path, 2, 2)
+            with open(path) as f:
+                self.assertEqual(f.read(), "old")
+
+    def test_generate_maze_writes_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = generate_maze(os.path.join(tmp, "maze.txt"), 11, 11, seed=5)
+            with open(path) as f:
+                lines = f.read().splitlines()
+        self.assertEqual(lines, list(iter_maze_rows(11, 11, seed=5)))
+
+if __name__ == "__main__":
+    unittest.main()
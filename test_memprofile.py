@@ -0,0 +1,66 @@
+import tracemalloc
+import unittest
+from unittest import mock
+import pygame
+from levels import PuzzleLevel, PlatformLevel
+from memprofile import level_memory, run_stress, process_rss, MemoryMonitor
+
+class TestLevelMemory(unittest.TestCase):
+    def test_report_counts_level_surfaces(self):
+        level = PuzzleLevel()
+        report = level_memory(level)
+        labels = [label for label, size, _ in report["surfaces"]]
+        self.assertIn("heart_image", labels)
+        self.assertIn("FallingObstacle", report["by_type"])
+        self.assertEqual(report["bytes"], sum(report["by_type"].values()))
+        level.release()
+
+class TestMemoryMonitor(unittest.TestCase):
+    def setUp(self):
+        self.was_tracing = tracemalloc.is_tracing()
+
+    def tearDown(self):
+        if not self.was_tracing:
+            tracemalloc.stop()
+
+    def test_reports_level_still_alive(self):
+        monitor = MemoryMonitor()
+        old_level = PlatformLevel()
+        monitor.level_loaded(None, old_level)
+        monitor.level_loaded(old_level, PlatformLevel())
+        self.assertEqual(monitor.leaked_levels(), [old_level])
+        report = monitor.level_loaded(None, PlatformLevel())
+        self.assertIn("Leak: released PlatformLevel", report)
+
+class TestStress(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.was_tracing = tracemalloc.is_tracing()
+
+    def test_level_cycle_does_not_grow(self):
+        readings = run_stress(cycles=90, warmup=30, samples=4)
+        self.assertGreater(len(readings), 1)
+
+    def test_too_few_cycles_rejected(self):
+        with self.assertRaises(ValueError):
+            run_stress(cycles=30, warmup=30)
+
+    @unittest.skipIf(process_rss() is None, "RSS is not available")
+    def test_surface_leak_fails(self):
+        leaked = []
+        create_level = PuzzleLevel.__init__
+
+        def leaking_init(level):
+            create_level(level)
+            leaked.append(pygame.Surface((1024, 512)))
+
+        with mock.patch.object(PuzzleLevel, "__init__", leaking_init):
+            with self.assertRaises(RuntimeError):
+                run_stress(cycles=90, warmup=30, samples=4)
+
+    def tearDown(self):
+        if not self.was_tracing:
+            tracemalloc.stop()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,6 +22,10 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(self.player.speed_x, 0)
         self.assertEqual(self.player.speed_y, 0)
 
+    def test_fallback_image_has_own_atlas_key(self):
+        fallback = Player(0, 0, image_path="maze1.txt", width=30, height=40)
+        self.assertNotEqual(fallback.atlas_key, self.player.atlas_key)
+
     def tearDown(self):
         pygame.quit()
 
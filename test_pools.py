@@ -0,0 +1,63 @@
+import unittest
+import pygame
+from pools import SpritePool, SurfacePool
+from components import FallingObstacle
+from levels import PuzzleLevel, obstacle_pool, falling_star_pool, hud_surfaces
+
+class TestSpritePool(unittest.TestCase):
+    def test_released_sprite_is_reused(self):
+        pool = SpritePool(FallingObstacle)
+        group = pygame.sprite.Group()
+        obstacle = pool.acquire(speed=3)
+        group.add(obstacle)
+        pool.release(obstacle)
+        self.assertEqual(len(group), 0)
+
+        obstacle.rect.y = 1000
+        reused = pool.acquire(speed=6)
+        self.assertIs(reused, obstacle)
+        self.assertEqual(reused.speed, 6)
+        self.assertLess(reused.rect.y, 0)
+        self.assertEqual(pool.created, 1)
+
+    def test_double_release_keeps_one_copy(self):
+        pool = SpritePool(FallingObstacle)
+        obstacle = pool.acquire()
+        pool.release(obstacle)
+        pool.release(obstacle)
+        self.assertEqual(len(pool.free), 1)
+
+class TestSurfacePool(unittest.TestCase):
+    def test_surface_reused_by_size(self):
+        pool = SurfacePool()
+        surface = pool.acquire((20, 10), pygame.SRCALPHA)
+        pool.release(surface)
+        self.assertIsNot(pool.acquire((20, 10)), surface)
+        self.assertIs(pool.acquire((20, 10), pygame.SRCALPHA), surface)
+
+class TestPuzzleLevelPooling(unittest.TestCase):
+    def test_restart_reuses_sprites(self):
+        PuzzleLevel().release()
+        created = (obstacle_pool.created, falling_star_pool.created)
+        for _ in range(5):
+            PuzzleLevel().release()
+        self.assertEqual(
+            (obstacle_pool.created, falling_star_pool.created), created
+        )
+
+class TestHudSurfaces(unittest.TestCase):
+    def test_hud_text_reuses_surfaces_by_size(self):
+        pygame.init()
+        font = pygame.font.SysFont(None, 30)
+        level = PuzzleLevel()
+        first = level.render_hud("stars", "1/3", font, (255, 255, 0))
+        self.assertIs(level.render_hud("stars", "1/3", font, (255, 255, 0)), first)
+        level.render_hud("stars", "1/3 ", font, (255, 255, 0))
+        created = hud_surfaces.created
+        again = level.render_hud("stars", "1/3", font, (255, 255, 0))
+        self.assertIs(again, first)
+        self.assertEqual(hud_surfaces.created, created)
+        level.release()
+
+if __name__ == "__main__":
+    unittest.main()